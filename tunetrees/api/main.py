@@ -33,11 +33,14 @@ async def feedback(
 ):
     logger = logging.getLogger("tunetrees.api")
     logger.debug(f"{selected_tune=}, {vote_type=}")
-    query_and_print_tune_by_id(634)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        query_and_print_tune_by_id(selected_tune)
 
     submit_review(selected_tune, vote_type)
 
-    query_and_print_tune_by_id(634)
+    if debug_enabled:
+        query_and_print_tune_by_id(selected_tune)
 
     html_result = RedirectResponse(
         "/tunetrees/practice", status_code=status.HTTP_302_FOUND
@@ -13,8 +13,14 @@ assert db_location_path
 
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{db_location_path.absolute()}"
 
+# Every request opens a short-lived session, so keep a LIFO pool big enough for
+# the API's concurrency; LIFO hands back the most recently used (warm) connection.
 sqlalchemy_database_engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_use_lifo=True,
+    pool_size=10,
+    max_overflow=20,
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sqlalchemy_database_engine)
 
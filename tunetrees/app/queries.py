@@ -2,7 +2,6 @@ from typing import List, Any, Dict
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session, Query
-from tabulate import tabulate
 
 from tunetrees.app.database import SessionLocal
 from tunetrees.models.tunetrees import (
@@ -28,6 +27,8 @@ def get_tune_table(
     query: Query[Any] = db.query(Tune)
     rows = query.offset(skip).limit(limit).all()
     if print_table:
+        from tabulate import tabulate
+
         rows_list = query_result_to_diagnostic_dict(rows, table_name="tune")
         print("\n----------")
         print(tabulate(rows_list, headers="keys"))
@@ -41,6 +42,8 @@ def get_practice_record_table(
     rows = query.offset(skip).limit(limit).all()
 
     if print_table:
+        from tabulate import tabulate
+
         rows_list = query_result_to_diagnostic_dict(rows, table_name="practice_record")
         print(tabulate(rows_list, headers="keys"))
 
@@ -78,6 +81,8 @@ def get_practice_list_scheduled(
     rows = scheduled_rows + aged_rows
 
     if print_table:
+        from tabulate import tabulate
+
         print("\n--------")
         print(tabulate(rows, headers=t_practice_list_joined.columns.keys()))
 
@@ -98,6 +103,8 @@ def get_practice_list_recently_played(
     )
 
     if print_table:
+        from tabulate import tabulate
+
         print("\n--------")
         print(tabulate(rows, headers=t_practice_list_joined.columns.keys()))
 
@@ -105,14 +112,9 @@ def get_practice_list_recently_played(
 
 
 def _run_experiment():
-    db = None
-    try:
-        db = SessionLocal()
+    with SessionLocal() as db:
         tunes: List[Tune] = get_practice_list_scheduled(db, limit=10, print_table=True)
         assert tunes
-    finally:
-        if db:
-            db.close()
 
 
 if __name__ == "__main__":
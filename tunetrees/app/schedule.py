@@ -1,164 +1,198 @@
+import logging
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List
 
-from sqlalchemy import select, update
-from tabulate import tabulate
+from sqlalchemy import bindparam, select, update
 
 from supermemo2 import SMTwo
 from tunetrees.app.database import SessionLocal
-from tunetrees.app.queries import (
-    get_practice_record_table,
-    query_result_to_diagnostic_dict,
-)
+from tunetrees.app.queries import query_result_to_diagnostic_dict
 from tunetrees.models.quality import quality_lookup
 from tunetrees.models.tunetrees import PracticeRecord
 
+logger = logging.getLogger(__name__)
+
 TT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Built once at import so the per-request paths only bind parameters; the
+# engine's compiled cache then hits on every call.
+_SELECT_PRACTICE_RECORD_BY_TUNE = select(PracticeRecord).where(
+    PracticeRecord.TUNE_REF == bindparam("tune_id")
+)
+_SELECT_REVIEW_STATE_BY_TUNE = select(
+    PracticeRecord.Easiness,
+    PracticeRecord.Interval,
+    PracticeRecord.Repetitions,
+).where(PracticeRecord.TUNE_REF == bindparam("tune_id"))
+_UPDATE_REVIEW_BY_TUNE = (
+    update(PracticeRecord)
+    .where(PracticeRecord.TUNE_REF == bindparam("tune_id"))
+    .values(
+        Easiness=bindparam("easiness"),
+        Interval=bindparam("interval"),
+        Repetitions=bindparam("repetitions"),
+        ReviewDate=bindparam("review_date"),
+        Quality=bindparam("quality"),
+        Practiced=bindparam("practiced"),
+    )
+)
+
 
-def backup_practiced_dates():  # sourcery skip: extract-method
-    db = None
+def _parse_tt_date(date_str: str) -> datetime:
+    """Parse a TT_DATE_FORMAT string without going through strptime."""
     try:
-        db = SessionLocal()
+        # TT_DATE_FORMAT is ISO 8601 with a space separator, which
+        # fromisoformat parses in C.
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        # Not in the canonical zero-padded layout; let strptime decide.
+        return datetime.strptime(date_str, TT_DATE_FORMAT)
 
-        practice_records: List[PracticeRecord] = get_practice_record_table(
-            db, limit=10000
-        )
 
-        for practice_record in practice_records:
-            if practice_record.Practiced:
-                practice_record.BackupPracticed = practice_record.Practiced
+def _format_tt_date(date: datetime) -> str:
+    """Format a naive datetime as a TT_DATE_FORMAT string without strftime."""
+    return date.isoformat(sep=" ", timespec="seconds")
 
-            print(
-                f"{practice_record.tune.Title=}, {practice_record.playlist.instrument=}, "
-                f"{practice_record.PLAYLIST_REF=}, {practice_record.TUNE_REF=}, "
-                f"{practice_record.Practiced=}, {practice_record.Feedback=}"
+
+def backup_practiced_dates():
+    with SessionLocal() as db:
+        # Copy the column inside the database; no rows are fetched or hydrated.
+        result = db.execute(
+            update(PracticeRecord)
+            .where(
+                PracticeRecord.Practiced.is_not(None), PracticeRecord.Practiced != ""
             )
+            .values(BackupPracticed=PracticeRecord.Practiced),
+            execution_options={"synchronize_session": False},
+        )
+        logger.debug("backed up practiced dates on %d records", result.rowcount)
 
         db.commit()
-        db.flush(objects=practice_records)
-
-    finally:
-        db.close()
 
 
 def initialize_review_records_from_practiced(
-    print_table=True, from_backup_practiced=True
+    print_table=False, from_backup_practiced=True
 ):  # sourcery skip: extract-method
-    db = None
-    try:
-        db = SessionLocal()
-
-        rows: List[PracticeRecord] = get_practice_record_table(db, limit=10000)
-
-        for row in rows:
-            # The values are:
-            #
-            #     Quality: The quality of recalling the answer from a scale of 0 to 5.
-            #         5: perfect response.
-            #         4: correct response after a hesitation.
-            #         3: correct response recalled with serious difficulty.
-            #         2: incorrect response; where the correct one seemed easy to recall.
-            #         1: incorrect response; the correct one remembered.
-            #         0: complete blackout.
-            #     Easiness: The easiness factor, a multiplier that affects the size of the interval, determine by the quality of the recall.
-            #     Interval: The gap/space between your next review.
-            #     Repetitions: The count of correct response (quality >= 3) you have in a row.
-
-            practiced_str = (
-                row.BackupPracticed if from_backup_practiced else row.Practiced
+    with SessionLocal() as db:
+        practiced_column = (
+            PracticeRecord.BackupPracticed
+            if from_backup_practiced
+            else PracticeRecord.Practiced
+        )
+        stmt = select(PracticeRecord.ID, practiced_column).where(
+            practiced_column.is_not(None), practiced_column != ""
+        )
+
+        # The values are:
+        #
+        #     Quality: The quality of recalling the answer from a scale of 0 to 5.
+        #         5: perfect response.
+        #         4: correct response after a hesitation.
+        #         3: correct response recalled with serious difficulty.
+        #         2: incorrect response; where the correct one seemed easy to recall.
+        #         1: incorrect response; the correct one remembered.
+        #         0: complete blackout.
+        #     Easiness: The easiness factor, a multiplier that affects the size of the interval, determine by the quality of the recall.
+        #     Interval: The gap/space between your next review.
+        #     Repetitions: The count of correct response (quality >= 3) you have in a row.
+        quality = 1  # could calculate from how recent, or??  Otherwise, ¯\_(ツ)_/¯
+
+        # With a fixed quality, a first review always yields the same easiness,
+        # interval and repetitions, and the review date is just the practiced
+        # date plus a fixed offset, so run SM-2 once rather than per row.
+        anchor = datetime(2000, 1, 1)
+        first_review = SMTwo.first_review(quality, anchor)
+        review_offset = first_review.review_date - anchor
+        easiness = first_review.easiness
+        interval = first_review.interval
+        repetitions = first_review.repetitions
+
+        rows_list: List[Dict[str, Any]] = []
+        for record_id, practiced_str in db.execute(stmt):
+            practiced = _parse_tt_date(practiced_str)
+            rows_list.append(
+                {
+                    "ID": record_id,
+                    "Practiced": practiced_str,
+                    "Easiness": easiness,
+                    "Interval": interval,
+                    "Repetitions": repetitions,
+                    "ReviewDate": _format_tt_date(practiced + review_offset),
+                    "Quality": quality,
+                }
             )
-            if not practiced_str:
-                continue
-            row.Practiced = practiced_str
-            quality = 1  # could calculate from how recent, or??  Otherwise, ¯\_(ツ)_/¯
-            practiced = datetime.strptime(practiced_str, TT_DATE_FORMAT)
-            review = SMTwo.first_review(quality, practiced)
-            row.Easiness = review.easiness
-            row.Interval = review.interval
-            row.Repetitions = review.repetitions
-            review_date_str = datetime.strftime(review.review_date, TT_DATE_FORMAT)
-            row.ReviewDate = review_date_str
-            row.Quality = quality
 
+        # ORM bulk UPDATE by primary key: one executemany, no per-object
+        # attribute history or unit-of-work flush.
+        if rows_list:
+            db.execute(update(PracticeRecord), rows_list)
         db.commit()
-        db.flush(objects=rows)
 
         if print_table:
-            rows_list = query_result_to_diagnostic_dict(
-                rows, table_name="practice_record"
-            )
+            from tabulate import tabulate
+
             print("\n----------")
             print(tabulate(rows_list, headers="keys"))
 
-    finally:
-        db.close()
-
 
 class BadTuneID(Exception):
     """Tune not found."""
 
 
 def submit_review(tune_id: int, feedback: str):
-    db = None
     quality = quality_lookup.get(feedback)
     if quality < 0:
         return
     assert quality <= quality_lookup.get("perfect")
     try:
-        db = SessionLocal()
-
-        practiced_str = datetime.strftime(datetime.now(), TT_DATE_FORMAT)
-        practiced = datetime.strptime(practiced_str, TT_DATE_FORMAT)
-
-        stmt = select(PracticeRecord).where(PracticeRecord.TUNE_REF == tune_id)
-        row = db.execute(stmt).one()[0]
-
-        review = SMTwo(row.Easiness, row.Interval, row.Repetitions).review(quality, practiced)
-        review_date_str = datetime.strftime(review.review_date, TT_DATE_FORMAT)
-
-        db.execute(
-            update(PracticeRecord)
-            .where(PracticeRecord.TUNE_REF == tune_id)
-            .values(
-                Easiness=review.easiness,
-                Interval=review.interval,
-                Repetitions=review.repetitions,
-                ReviewDate=review_date_str,
-                Quality=quality,
-                Practiced=practiced_str,
-            ),
-            execution_options={"synchronize_session": False},
-        )
+        with SessionLocal() as db:
+            practiced = datetime.now().replace(microsecond=0)
+            practiced_str = _format_tt_date(practiced)
+
+            easiness, interval, repetitions = db.execute(
+                _SELECT_REVIEW_STATE_BY_TUNE, {"tune_id": tune_id}
+            ).one()
+
+            review = SMTwo(easiness, interval, repetitions).review(quality, practiced)
+            review_date_str = _format_tt_date(review.review_date)
+
+            db.execute(
+                _UPDATE_REVIEW_BY_TUNE,
+                {
+                    "tune_id": tune_id,
+                    "easiness": review.easiness,
+                    "interval": review.interval,
+                    "repetitions": review.repetitions,
+                    "review_date": review_date_str,
+                    "quality": quality,
+                    "practiced": practiced_str,
+                },
+                execution_options={"synchronize_session": False},
+            )
 
-        db.commit()
-        db.flush()
+            db.commit()
 
     except Exception as e:
         print(f"Exception occurred when updating practice record {e}")
         raise
-    finally:
-        if db:
-            db.close()
 
 
 def query_and_print_tune_by_id(tune_id: int, print_table=True):
-    db = None
-    try:
-        db = SessionLocal()
-
-        stmt = select(PracticeRecord).where(PracticeRecord.TUNE_REF == tune_id)
-        rows = [db.execute(stmt).one()[0]]
+    with SessionLocal() as db:
+        rows = [
+            db.execute(
+                _SELECT_PRACTICE_RECORD_BY_TUNE, {"tune_id": tune_id}
+            ).scalar_one()
+        ]
 
         if print_table:
+            from tabulate import tabulate
+
             rows_list = query_result_to_diagnostic_dict(
                 rows, table_name="practice_record"
             )
             print("\n----------")
             print(tabulate(rows_list, headers="keys"))
-    finally:
-        if db:
-            db.close()
 
 
 if __name__ == "__main__":
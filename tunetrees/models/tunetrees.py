@@ -90,6 +90,9 @@ t_playlist_tune = Table(
 
 class PracticeRecord(Base):
     __tablename__ = 'practice_record'
+    __table_args__ = (
+        Index('practice_record_TUNE_REF_PLAYLIST_REF_index', 'TUNE_REF', 'PLAYLIST_REF'),
+    )
 
     PLAYLIST_REF = Column(ForeignKey('playlist.PLAYLIST_ID'))
     TUNE_REF = Column(ForeignKey('tune.ID'))